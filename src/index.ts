@@ -2,15 +2,17 @@ import "dotenv/config";
 import { loadPromptFromTemplate } from "./prompts/loader.js";
 import { Server } from "@modelcontextprotocol/sdk/server/index.js";
 import { StdioServerTransport } from "@modelcontextprotocol/sdk/server/stdio.js";
+import { z } from "zod";
 import { zodToJsonSchema } from "zod-to-json-schema";
 import {
   CallToolRequest,
   CallToolRequestSchema,
   ListToolsRequestSchema,
   InitializedNotificationSchema,
+  RootsListChangedNotificationSchema,
 } from "@modelcontextprotocol/sdk/types.js";
-import { setGlobalServer } from "./utils/paths.js";
-import { createWebServer } from "./web/webServer.js";
+import { setGlobalServer, invalidateRootsCache } from "./utils/paths.js";
+import type { createWebServer } from "./web/webServer.js";
 
 // 導入所有工具函數和 schema
 // Import all tool functions and schemas
@@ -49,6 +51,146 @@ import {
   researchModeSchema,
 } from "./tools/index.js";
 
+// 工具定義：名稱、描述模板路徑與預先轉換的輸入 schema
+// Tool definitions: name, description template path and pre-converted input schema
+const TOOL_DEFINITIONS = [
+  {
+    name: "plan_task",
+    descriptionTemplate: "toolsDescription/planTask.md",
+    inputSchema: zodToJsonSchema(planTaskSchema),
+  },
+  {
+    name: "analyze_task",
+    descriptionTemplate: "toolsDescription/analyzeTask.md",
+    inputSchema: zodToJsonSchema(analyzeTaskSchema),
+  },
+  {
+    name: "reflect_task",
+    descriptionTemplate: "toolsDescription/reflectTask.md",
+    inputSchema: zodToJsonSchema(reflectTaskSchema),
+  },
+  {
+    name: "split_tasks",
+    descriptionTemplate: "toolsDescription/splitTasks.md",
+    inputSchema: zodToJsonSchema(splitTasksRawSchema),
+  },
+  {
+    name: "list_tasks",
+    descriptionTemplate: "toolsDescription/listTasks.md",
+    inputSchema: zodToJsonSchema(listTasksSchema),
+  },
+  {
+    name: "execute_task",
+    descriptionTemplate: "toolsDescription/executeTask.md",
+    inputSchema: zodToJsonSchema(executeTaskSchema),
+  },
+  {
+    name: "verify_task",
+    descriptionTemplate: "toolsDescription/verifyTask.md",
+    inputSchema: zodToJsonSchema(verifyTaskSchema),
+  },
+  {
+    name: "delete_task",
+    descriptionTemplate: "toolsDescription/deleteTask.md",
+    inputSchema: zodToJsonSchema(deleteTaskSchema),
+  },
+  {
+    name: "clear_all_tasks",
+    descriptionTemplate: "toolsDescription/clearAllTasks.md",
+    inputSchema: zodToJsonSchema(clearAllTasksSchema),
+  },
+  {
+    name: "update_task",
+    descriptionTemplate: "toolsDescription/updateTask.md",
+    inputSchema: zodToJsonSchema(updateTaskContentSchema),
+  },
+  {
+    name: "query_task",
+    descriptionTemplate: "toolsDescription/queryTask.md",
+    inputSchema: zodToJsonSchema(queryTaskSchema),
+  },
+  {
+    name: "get_task_detail",
+    descriptionTemplate: "toolsDescription/getTaskDetail.md",
+    inputSchema: zodToJsonSchema(getTaskDetailSchema),
+  },
+  {
+    name: "process_thought",
+    descriptionTemplate: "toolsDescription/processThought.md",
+    inputSchema: zodToJsonSchema(processThoughtSchema),
+  },
+  {
+    name: "init_project_rules",
+    descriptionTemplate: "toolsDescription/initProjectRules.md",
+    inputSchema: zodToJsonSchema(initProjectRulesSchema),
+  },
+  {
+    name: "research_mode",
+    descriptionTemplate: "toolsDescription/researchMode.md",
+    inputSchema: zodToJsonSchema(researchModeSchema),
+  },
+];
+
+/**
+ * 包裝工具函數：先以 schema 驗證參數，再呼叫工具
+ * Wrap a tool function: validate arguments against its schema, then call the tool
+ */
+function withParsedArgs<TSchema extends z.ZodTypeAny, TResult>(
+  toolName: string,
+  schema: TSchema,
+  handler: (args: z.infer<TSchema>) => Promise<TResult>
+): (args: unknown) => Promise<TResult> {
+  return async (args: unknown) => {
+    const parsedArgs = await schema.safeParseAsync(args);
+    if (!parsedArgs.success) {
+      throw new Error(
+        `Invalid arguments for tool ${toolName}: ${parsedArgs.error.message}`
+      );
+    }
+    return await handler(parsedArgs.data);
+  };
+}
+
+// 工具呼叫分派表：工具名稱對應到驗證參數後的處理函數
+// Tool call dispatch table: maps tool names to handlers that validate their arguments
+const TOOL_HANDLERS = {
+  plan_task: withParsedArgs("plan_task", planTaskSchema, planTask),
+  analyze_task: withParsedArgs("analyze_task", analyzeTaskSchema, analyzeTask),
+  reflect_task: withParsedArgs("reflect_task", reflectTaskSchema, reflectTask),
+  split_tasks: withParsedArgs("split_tasks", splitTasksRawSchema, splitTasksRaw),
+  list_tasks: withParsedArgs("list_tasks", listTasksSchema, listTasks),
+  execute_task: withParsedArgs("execute_task", executeTaskSchema, executeTask),
+  verify_task: withParsedArgs("verify_task", verifyTaskSchema, verifyTask),
+  delete_task: withParsedArgs("delete_task", deleteTaskSchema, deleteTask),
+  clear_all_tasks: withParsedArgs(
+    "clear_all_tasks",
+    clearAllTasksSchema,
+    clearAllTasks
+  ),
+  update_task: withParsedArgs(
+    "update_task",
+    updateTaskContentSchema,
+    updateTaskContent
+  ),
+  query_task: withParsedArgs("query_task", queryTaskSchema, queryTask),
+  get_task_detail: withParsedArgs(
+    "get_task_detail",
+    getTaskDetailSchema,
+    getTaskDetail
+  ),
+  process_thought: withParsedArgs(
+    "process_thought",
+    processThoughtSchema,
+    processThought
+  ),
+  init_project_rules: (_args: unknown) => initProjectRules(),
+  research_mode: withParsedArgs(
+    "research_mode",
+    researchModeSchema,
+    researchMode
+  ),
+};
+
 async function main() {
   try {
     const ENABLE_GUI = process.env.ENABLE_GUI === "true";
@@ -74,127 +216,40 @@ async function main() {
     // Set global server instance
     setGlobalServer(server);
 
+    // 客戶端 roots 變更時清除快取，下次取得 DATA_DIR 時重新查詢
+    // Clear the roots cache when the client's roots change, so DATA_DIR is re-resolved on next use
+    server.setNotificationHandler(
+      RootsListChangedNotificationSchema,
+      async () => {
+        invalidateRootsCache();
+      }
+    );
+
     // 監聽 initialized 通知來啟動 web 服務器
     // Listen for initialized notification to start web server
     if (ENABLE_GUI) {
       server.setNotificationHandler(InitializedNotificationSchema, async () => {
         try {
-          webServerInstance = await createWebServer();
+          // 僅在啟用 GUI 時才載入 web 服務器（及 express）
+          // Only load the web server (and express) when the GUI is enabled
+          const webServer = await import("./web/webServer.js");
+          webServerInstance = await webServer.createWebServer();
           await webServerInstance.startServer();
         } catch (error) {}
       });
     }
 
     server.setRequestHandler(ListToolsRequestSchema, async () => {
-      return {
-        tools: [
-          {
-            name: "plan_task",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/planTask.md"
-            ),
-            inputSchema: zodToJsonSchema(planTaskSchema),
-          },
-          {
-            name: "analyze_task",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/analyzeTask.md"
-            ),
-            inputSchema: zodToJsonSchema(analyzeTaskSchema),
-          },
-          {
-            name: "reflect_task",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/reflectTask.md"
-            ),
-            inputSchema: zodToJsonSchema(reflectTaskSchema),
-          },
-          {
-            name: "split_tasks",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/splitTasks.md"
-            ),
-            inputSchema: zodToJsonSchema(splitTasksRawSchema),
-          },
-          {
-            name: "list_tasks",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/listTasks.md"
-            ),
-            inputSchema: zodToJsonSchema(listTasksSchema),
-          },
-          {
-            name: "execute_task",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/executeTask.md"
-            ),
-            inputSchema: zodToJsonSchema(executeTaskSchema),
-          },
-          {
-            name: "verify_task",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/verifyTask.md"
-            ),
-            inputSchema: zodToJsonSchema(verifyTaskSchema),
-          },
-          {
-            name: "delete_task",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/deleteTask.md"
-            ),
-            inputSchema: zodToJsonSchema(deleteTaskSchema),
-          },
-          {
-            name: "clear_all_tasks",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/clearAllTasks.md"
-            ),
-            inputSchema: zodToJsonSchema(clearAllTasksSchema),
-          },
-          {
-            name: "update_task",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/updateTask.md"
-            ),
-            inputSchema: zodToJsonSchema(updateTaskContentSchema),
-          },
-          {
-            name: "query_task",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/queryTask.md"
-            ),
-            inputSchema: zodToJsonSchema(queryTaskSchema),
-          },
-          {
-            name: "get_task_detail",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/getTaskDetail.md"
-            ),
-            inputSchema: zodToJsonSchema(getTaskDetailSchema),
-          },
-          {
-            name: "process_thought",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/processThought.md"
-            ),
-            inputSchema: zodToJsonSchema(processThoughtSchema),
-          },
-          {
-            name: "init_project_rules",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/initProjectRules.md"
-            ),
-            inputSchema: zodToJsonSchema(initProjectRulesSchema),
-          },
-          {
-            name: "research_mode",
-            description: await loadPromptFromTemplate(
-              "toolsDescription/researchMode.md"
-            ),
-            inputSchema: zodToJsonSchema(researchModeSchema),
-          },
-        ],
-      };
+      // 各工具描述彼此獨立，並行載入
+      // Tool descriptions are independent, so load them concurrently
+      const tools = await Promise.all(
+        TOOL_DEFINITIONS.map(async (tool) => ({
+          name: tool.name,
+          description: await loadPromptFromTemplate(tool.descriptionTemplate),
+          inputSchema: tool.inputSchema,
+        }))
+      );
+      return { tools };
     });
 
     server.setRequestHandler(
@@ -205,153 +260,16 @@ async function main() {
             throw new Error("No arguments provided");
           }
 
-          let parsedArgs;
-          switch (request.params.name) {
-            case "plan_task":
-              parsedArgs = await planTaskSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await planTask(parsedArgs.data);
-            case "analyze_task":
-              parsedArgs = await analyzeTaskSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await analyzeTask(parsedArgs.data);
-            case "reflect_task":
-              parsedArgs = await reflectTaskSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await reflectTask(parsedArgs.data);
-            case "split_tasks":
-              parsedArgs = await splitTasksRawSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await splitTasksRaw(parsedArgs.data);
-            case "list_tasks":
-              parsedArgs = await listTasksSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await listTasks(parsedArgs.data);
-            case "execute_task":
-              parsedArgs = await executeTaskSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await executeTask(parsedArgs.data);
-            case "verify_task":
-              parsedArgs = await verifyTaskSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await verifyTask(parsedArgs.data);
-            case "delete_task":
-              parsedArgs = await deleteTaskSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await deleteTask(parsedArgs.data);
-            case "clear_all_tasks":
-              parsedArgs = await clearAllTasksSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await clearAllTasks(parsedArgs.data);
-            case "update_task":
-              parsedArgs = await updateTaskContentSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await updateTaskContent(parsedArgs.data);
-            case "query_task":
-              parsedArgs = await queryTaskSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await queryTask(parsedArgs.data);
-            case "get_task_detail":
-              parsedArgs = await getTaskDetailSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await getTaskDetail(parsedArgs.data);
-            case "process_thought":
-              parsedArgs = await processThoughtSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await processThought(parsedArgs.data);
-            case "init_project_rules":
-              return await initProjectRules();
-            case "research_mode":
-              parsedArgs = await researchModeSchema.safeParseAsync(
-                request.params.arguments
-              );
-              if (!parsedArgs.success) {
-                throw new Error(
-                  `Invalid arguments for tool ${request.params.name}: ${parsedArgs.error.message}`
-                );
-              }
-              return await researchMode(parsedArgs.data);
-            default:
-              throw new Error(`Tool ${request.params.name} does not exist`);
+          const toolHandler = Object.prototype.hasOwnProperty.call(
+            TOOL_HANDLERS,
+            request.params.name
+          )
+            ? TOOL_HANDLERS[request.params.name as keyof typeof TOOL_HANDLERS]
+            : undefined;
+          if (!toolHandler) {
+            throw new Error(`Tool ${request.params.name} does not exist`);
           }
+          return await toolHandler(request.params.arguments);
         } catch (error) {
           const errorMsg =
             error instanceof Error ? error.message : String(error);
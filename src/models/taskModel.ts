@@ -13,7 +13,7 @@ import { v4 as uuidv4 } from "uuid";
 import { fileURLToPath } from "url";
 import { exec } from "child_process";
 import { promisify } from "util";
-import { getDataDir, getTasksFilePath, getMemoryDir } from "../utils/paths.js";
+import { getTasksFilePath, getMemoryDir } from "../utils/paths.js";
 
 const execAsync = promisify(exec);
 
@@ -49,9 +49,9 @@ async function initGitIfNeeded(dataDir: string): Promise<void> {
     // Git already initialized
   } catch {
     // Initialize git repository
-    await execAsync(`cd "${dataDir}" && git init`);
-    await execAsync(`cd "${dataDir}" && git config user.name "Shrimp Task Manager"`);
-    await execAsync(`cd "${dataDir}" && git config user.email "shrimp@task-manager.local"`);
+    await execAsync(
+      `cd "${dataDir}" && git init && git config user.name "Shrimp Task Manager" && git config user.email "shrimp@task-manager.local"`
+    );
     
     // Create .gitignore
     const gitignore = `# Temporary files
@@ -65,18 +65,18 @@ Thumbs.db
     await fs.writeFile(path.join(dataDir, '.gitignore'), gitignore);
     
     // Initial commit
-    await execAsync(`cd "${dataDir}" && git add .`);
-    await execAsync(`cd "${dataDir}" && git commit -m "Initial commit: Initialize task repository"`);
+    await execAsync(
+      `cd "${dataDir}" && git add . && git commit -m "Initial commit: Initialize task repository"`
+    );
   }
 }
 
 async function commitTaskChanges(dataDir: string, message: string, details?: string): Promise<void> {
   try {
-    // Stage the tasks.json file
-    await execAsync(`cd "${dataDir}" && git add tasks.json`);
-    
-    // Check if there are changes to commit
-    const { stdout } = await execAsync(`cd "${dataDir}" && git status --porcelain tasks.json`);
+    // Stage the tasks.json file and check if there are changes to commit
+    const { stdout } = await execAsync(
+      `cd "${dataDir}" && git add tasks.json && git status --porcelain tasks.json`
+    );
     
     if (stdout.trim()) {
       // There are changes to commit
@@ -107,11 +107,13 @@ const PROJECT_ROOT = path.resolve(__dirname, "../..");
 // Convert exec to Promise form
 const execPromise = promisify(exec);
 
-// 確保數據目錄存在
-// Ensure data directory exists
-async function ensureDataDir() {
-  const DATA_DIR = await getDataDir();
+// 確保數據目錄存在，並回傳解析後的路徑供呼叫端重用
+// Ensure data directory exists and return the resolved paths for callers to reuse
+async function ensureDataDir(): Promise<{ DATA_DIR: string; TASKS_FILE: string }> {
+  // 只解析一次路徑（可能需要向客戶端查詢 roots）
+  // Resolve paths only once (may require querying roots from the client)
   const TASKS_FILE = await getTasksFilePath();
+  const DATA_DIR = path.dirname(TASKS_FILE);
 
   try {
     await fs.access(DATA_DIR);
@@ -124,13 +126,14 @@ async function ensureDataDir() {
   } catch (error) {
     await fs.writeFile(TASKS_FILE, JSON.stringify({ tasks: [] }));
   }
+
+  return { DATA_DIR, TASKS_FILE };
 }
 
 // 讀取所有任務
 // Read all tasks
 async function readTasks(): Promise<Task[]> {
-  await ensureDataDir();
-  const TASKS_FILE = await getTasksFilePath();
+  const { TASKS_FILE } = await ensureDataDir();
   const data = await fs.readFile(TASKS_FILE, "utf-8");
   const tasks = JSON.parse(data).tasks;
 
@@ -147,9 +150,7 @@ async function readTasks(): Promise<Task[]> {
 // 寫入所有任務
 // Write all tasks
 async function writeTasks(tasks: Task[], commitMessage?: string): Promise<void> {
-  await ensureDataDir();
-  const TASKS_FILE = await getTasksFilePath();
-  const DATA_DIR = await getDataDir();
+  const { DATA_DIR, TASKS_FILE } = await ensureDataDir();
   
   // Initialize git if needed
   await initGitIfNeeded(DATA_DIR);
@@ -163,6 +164,10 @@ async function writeTasks(tasks: Task[], commitMessage?: string): Promise<void>
   }
 }
 
+// 已完成任務仍允許更新的欄位：summary（任務摘要）和 relatedFiles
+// Fields that may still be updated on completed tasks: summary (task summary) and relatedFiles
+const COMPLETED_TASK_UPDATABLE_FIELDS = new Set(["summary", "relatedFiles"]);
+
 // 獲取所有任務
 // Get all tasks
 export async function getAllTasks(): Promise<Task[]> {
@@ -192,6 +197,7 @@ export async function createTask(
     taskId,
   }));
 
+  const now = getLocalDate();
   const newTask: Task = {
     id: uuidv4(),
     name,
@@ -199,8 +205,8 @@ export async function createTask(
     notes,
     status: TaskStatus.PENDING,
     dependencies: dependencyObjects,
-    createdAt: getLocalDate(),
-    updatedAt: getLocalDate(),
+    createdAt: now,
+    updatedAt: now,
     relatedFiles,
     agent,
   };
@@ -230,14 +236,11 @@ export async function updateTask(
   if (tasks[taskIndex].status === TaskStatus.COMPLETED) {
     // 僅允許更新 summary 欄位（任務摘要）和 relatedFiles 欄位
     // Only allow updating summary field (task summary) and relatedFiles field
-    const allowedFields = ["summary", "relatedFiles"];
-    const attemptedFields = Object.keys(updates);
-
-    const disallowedFields = attemptedFields.filter(
-      (field) => !allowedFields.includes(field)
+    const hasDisallowedField = Object.keys(updates).some(
+      (field) => !COMPLETED_TASK_UPDATABLE_FIELDS.has(field)
     );
 
-    if (disallowedFields.length > 0) {
+    if (hasDisallowedField) {
       return null;
     }
   }
@@ -465,6 +468,17 @@ export async function batchCreateOrUpdateTasks(
   // Create list of new tasks
   const newTasks: Task[] = [];
 
+  // 同一批次的任務共用一個時間戳
+  // Tasks in the same batch share one timestamp
+  const now = getLocalDate();
+
+  // 以ID索引現有任務，並記錄被更新的任務ID，避免在迴圈中重複線性搜尋
+  // Index existing tasks by ID and record updated task IDs, avoiding repeated linear scans inside the loop
+  const existingTasksById = new Map(
+    existingTasks.map((task) => [task.id, task])
+  );
+  const updatedTaskIds = new Set<string>();
+
   for (const taskData of taskDataList) {
     // 檢查是否為選擇性更新模式且該任務名稱已存在
   // Check if it is selective update mode and the task name already exists
@@ -475,17 +489,11 @@ export async function batchCreateOrUpdateTasks(
 
       // 查找現有任務
       // Find existing task
-      const existingTaskIndex = existingTasks.findIndex(
-        (task) => task.id === existingTaskId
-      );
+      const taskToUpdate = existingTasksById.get(existingTaskId);
 
       // 如果找到現有任務並且該任務未完成，則更新它
       // If existing task is found and not completed, update it
-      if (
-        existingTaskIndex !== -1 &&
-        existingTasks[existingTaskIndex].status !== TaskStatus.COMPLETED
-      ) {
-        const taskToUpdate = existingTasks[existingTaskIndex];
+      if (taskToUpdate && taskToUpdate.status !== TaskStatus.COMPLETED) {
 
         // 更新任務
         // 更新任務的基本信息，但保留原始ID、創建時間等
@@ -497,7 +505,7 @@ export async function batchCreateOrUpdateTasks(
           notes: taskData.notes,
           // 後面會處理 dependencies
           // Dependencies will be processed later
-          updatedAt: getLocalDate(),
+          updatedAt: now,
           // 新增：保存實現指南（如果有）
           // New: Save implementation guide (if any)
           implementationGuide: taskData.implementationGuide,
@@ -521,9 +529,9 @@ export async function batchCreateOrUpdateTasks(
         // Add updated task to new task list
         newTasks.push(updatedTask);
 
-        // 從tasksToKeep中移除此任務，因為它已經被更新並添加到newTasks中了
-        // Remove this task from tasksToKeep because it has been updated and added to newTasks
-        tasksToKeep = tasksToKeep.filter((task) => task.id !== existingTaskId);
+        // 記錄此任務，稍後從tasksToKeep中移除，因為它已經被更新並添加到newTasks中了
+        // Record this task for removal from tasksToKeep, because it has been updated and added to newTasks
+        updatedTaskIds.add(existingTaskId);
       }
     } else {
       // 創建新任務
@@ -542,8 +550,8 @@ export async function batchCreateOrUpdateTasks(
         notes: taskData.notes,
         status: TaskStatus.PENDING,
         dependencies: [], // 後面會填充
-        createdAt: getLocalDate(),
-        updatedAt: getLocalDate(),
+        createdAt: now,
+        updatedAt: now,
         relatedFiles: taskData.relatedFiles,
         // 新增：保存實現指南（如果有）
         implementationGuide: taskData.implementationGuide,
@@ -559,6 +567,22 @@ export async function batchCreateOrUpdateTasks(
     }
   }
 
+  // 一次性移除已被更新的任務
+  // Remove updated tasks in a single pass
+  if (updatedTaskIds.size > 0) {
+    tasksToKeep = tasksToKeep.filter((task) => !updatedTaskIds.has(task.id));
+  }
+
+  // 所有保留及新建任務的ID集合，用於驗證UUID格式的依賴
+  // IDs of all kept and new tasks, used to validate UUID-format dependencies
+  const knownTaskIds = new Set<string>();
+  for (const task of tasksToKeep) {
+    knownTaskIds.add(task.id);
+  }
+  for (const task of newTasks) {
+    knownTaskIds.add(task.id);
+  }
+
   // 處理任務之間的依賴關係
   // Handle dependencies between tasks
   for (let i = 0; i < taskDataList.length; i++) {
@@ -592,10 +616,7 @@ export async function batchCreateOrUpdateTasks(
         } else {
           // 是UUID格式，但需要確認此ID是否對應實際存在的任務
           // Is UUID format, but need to confirm if this ID corresponds to an actually existing task
-          const idExists = [...tasksToKeep, ...newTasks].some(
-            (task) => task.id === dependencyTaskId
-          );
-          if (!idExists) {
+          if (!knownTaskIds.has(dependencyTaskId)) {
             continue; // 跳過此依賴 - Skip this dependency
           }
         }
@@ -671,11 +692,12 @@ export async function deleteTask(
     return { success: false, message: "無法刪除已完成的任務" };
   }
 
-  // 檢查是否有其他任務依賴此任務
-  // Check if other tasks depend on this task
-  const allTasks = tasks.filter((_, index) => index !== taskIndex);
-  const dependentTasks = allTasks.filter((task) =>
-    task.dependencies.some((dep) => dep.taskId === taskId)
+  // 檢查是否有其他任務依賴此任務（單次遍歷，跳過任務本身）
+  // Check if other tasks depend on this task (single pass, skipping the task itself)
+  const dependentTasks = tasks.filter(
+    (task, index) =>
+      index !== taskIndex &&
+      task.dependencies.some((dep) => dep.taskId === taskId)
   );
 
   if (dependentTasks.length > 0) {
@@ -697,6 +719,37 @@ export async function deleteTask(
   return { success: true, message: "任務刪除成功" };
 }
 
+// 複雜度級別，由低到高排列，索引即為級別高低
+// Complexity levels ordered from low to high; the index is the rank
+const COMPLEXITY_LEVELS = [
+  TaskComplexityLevel.LOW,
+  TaskComplexityLevel.MEDIUM,
+  TaskComplexityLevel.HIGH,
+  TaskComplexityLevel.VERY_HIGH,
+];
+
+// 由高到低檢查的閾值鍵名，與 COMPLEXITY_LEVELS 的索引對應
+// Threshold keys checked from high to low, paired with their COMPLEXITY_LEVELS rank
+const COMPLEXITY_THRESHOLD_RANKS = [
+  ["VERY_HIGH", 3],
+  ["HIGH", 2],
+  ["MEDIUM", 1],
+] as const;
+
+// 取得單一指標達到的複雜度級別索引
+// Get the complexity rank reached by a single indicator
+function getComplexityRank(
+  value: number,
+  thresholds: { MEDIUM: number; HIGH: number; VERY_HIGH: number }
+): number {
+  for (const [key, rank] of COMPLEXITY_THRESHOLD_RANKS) {
+    if (value >= thresholds[key]) {
+      return rank;
+    }
+  }
+  return 0;
+}
+
 // 評估任務複雜度
 // Assess task complexity
 export async function assessTaskComplexity(
@@ -715,61 +768,22 @@ export async function assessTaskComplexity(
   const notesLength = task.notes ? task.notes.length : 0;
   const hasNotes = !!task.notes;
 
-  // 基於各項指標評估複雜度級別
-  // Assess complexity level based on various indicators
-  let level = TaskComplexityLevel.LOW;
-
-  // 描述長度評估
-  // Description length assessment
-  if (
-    descriptionLength >= TaskComplexityThresholds.DESCRIPTION_LENGTH.VERY_HIGH
-  ) {
-    level = TaskComplexityLevel.VERY_HIGH;
-  } else if (
-    descriptionLength >= TaskComplexityThresholds.DESCRIPTION_LENGTH.HIGH
-  ) {
-    level = TaskComplexityLevel.HIGH;
-  } else if (
-    descriptionLength >= TaskComplexityThresholds.DESCRIPTION_LENGTH.MEDIUM
-  ) {
-    level = TaskComplexityLevel.MEDIUM;
-  }
-
-  // 依賴數量評估（取最高級別）
-  // Dependencies count assessment (take highest level)
-  if (
-    dependenciesCount >= TaskComplexityThresholds.DEPENDENCIES_COUNT.VERY_HIGH
-  ) {
-    level = TaskComplexityLevel.VERY_HIGH;
-  } else if (
-    dependenciesCount >= TaskComplexityThresholds.DEPENDENCIES_COUNT.HIGH &&
-    level !== TaskComplexityLevel.VERY_HIGH
-  ) {
-    level = TaskComplexityLevel.HIGH;
-  } else if (
-    dependenciesCount >= TaskComplexityThresholds.DEPENDENCIES_COUNT.MEDIUM &&
-    level !== TaskComplexityLevel.HIGH &&
-    level !== TaskComplexityLevel.VERY_HIGH
-  ) {
-    level = TaskComplexityLevel.MEDIUM;
-  }
-
-  // 注記長度評估（取最高級別）
-  // Notes length assessment (take highest level)
-  if (notesLength >= TaskComplexityThresholds.NOTES_LENGTH.VERY_HIGH) {
-    level = TaskComplexityLevel.VERY_HIGH;
-  } else if (
-    notesLength >= TaskComplexityThresholds.NOTES_LENGTH.HIGH &&
-    level !== TaskComplexityLevel.VERY_HIGH
-  ) {
-    level = TaskComplexityLevel.HIGH;
-  } else if (
-    notesLength >= TaskComplexityThresholds.NOTES_LENGTH.MEDIUM &&
-    level !== TaskComplexityLevel.HIGH &&
-    level !== TaskComplexityLevel.VERY_HIGH
-  ) {
-    level = TaskComplexityLevel.MEDIUM;
-  }
+  // 基於各項指標評估複雜度級別，取各指標中的最高級別
+  // Assess complexity level based on various indicators, taking the highest level across indicators
+  const level =
+    COMPLEXITY_LEVELS[
+      Math.max(
+        getComplexityRank(
+          descriptionLength,
+          TaskComplexityThresholds.DESCRIPTION_LENGTH
+        ),
+        getComplexityRank(
+          dependenciesCount,
+          TaskComplexityThresholds.DEPENDENCIES_COUNT
+        ),
+        getComplexityRank(notesLength, TaskComplexityThresholds.NOTES_LENGTH)
+      )
+    ];
 
   // 根據複雜度級別生成處理建議
   // Generate processing suggestions based on complexity level
@@ -982,57 +996,46 @@ export async function searchTasksWithCommand(
             .reverse()
             .slice(0, MAX_FILES_TO_READ);
 
-          // 只處理符合條件的檔案
-          // Only process files that meet criteria
-          for (const filePath of sortedFiles) {
-            try {
-              const data = await fs.readFile(filePath, "utf-8");
-              const tasks = JSON.parse(data).tasks || [];
-
-              // 格式化日期字段
-              // Format date fields
-              const formattedTasks = tasks.map((task: any) => ({
-                ...task,
-                createdAt: task.createdAt
-                  ? new Date(task.createdAt)
-                  : getLocalDate(),
-                updatedAt: task.updatedAt
-                  ? new Date(task.updatedAt)
-                  : getLocalDate(),
-                completedAt: task.completedAt
-                  ? new Date(task.completedAt)
-                  : undefined,
-              }));
-
-              // 進一步過濾任務確保符合條件
-              // Further filter tasks to ensure criteria are met
-              const filteredTasks = isId
-                ? formattedTasks.filter((task: Task) => task.id === query)
-                : formattedTasks.filter((task: Task) => {
-                    const keywords = query
-                      .split(/\s+/)
-                      .filter((k) => k.length > 0);
-                    if (keywords.length === 0) return true;
-
-                    return keywords.every((keyword) => {
-                      const lowerKeyword = keyword.toLowerCase();
-                      return (
-                        task.name.toLowerCase().includes(lowerKeyword) ||
-                        task.description.toLowerCase().includes(lowerKeyword) ||
-                        (task.notes &&
-                          task.notes.toLowerCase().includes(lowerKeyword)) ||
-                        (task.implementationGuide &&
-                          task.implementationGuide
-                            .toLowerCase()
-                            .includes(lowerKeyword)) ||
-                        (task.summary &&
-                          task.summary.toLowerCase().includes(lowerKeyword))
-                      );
-                    });
-                  });
-
-              memoryTasks.push(...filteredTasks);
-            } catch (error: unknown) {}
+          // 只處理符合條件的檔案，並行讀取（數量已由 MAX_FILES_TO_READ 限制）
+          // Only process files that meet criteria, reading them concurrently (bounded by MAX_FILES_TO_READ)
+          const tasksPerFile = await Promise.all(
+            sortedFiles.map(async (filePath): Promise<Task[]> => {
+              try {
+                const data = await fs.readFile(filePath, "utf-8");
+                const tasks = JSON.parse(data).tasks || [];
+
+                // 格式化日期字段
+                // Format date fields
+                const formattedTasks = tasks.map((task: any) => ({
+                  ...task,
+                  createdAt: task.createdAt
+                    ? new Date(task.createdAt)
+                    : getLocalDate(),
+                  updatedAt: task.updatedAt
+                    ? new Date(task.updatedAt)
+                    : getLocalDate(),
+                  completedAt: task.completedAt
+                    ? new Date(task.completedAt)
+                    : undefined,
+                }));
+
+                // 進一步過濾任務確保符合條件
+                // Further filter tasks to ensure criteria are met
+                const filteredTasks = filterTasksByQuery(
+                  formattedTasks,
+                  query,
+                  isId
+                );
+
+                return filteredTasks;
+              } catch (error: unknown) {
+                return [];
+              }
+            })
+          );
+
+          for (const fileTasks of tasksPerFile) {
+            memoryTasks.push(...fileTasks);
           }
         }
       } catch (error: unknown) {}
@@ -1041,7 +1044,7 @@ export async function searchTasksWithCommand(
 
   // 從當前任務中過濾符合條件的任務
   // Filter qualifying tasks from current tasks
-  const filteredCurrentTasks = filterCurrentTasks(currentTasks, query, isId);
+  const filteredCurrentTasks = filterTasksByQuery(currentTasks, query, isId);
 
   // 合併結果並去重
   // Merge results and deduplicate
@@ -1174,31 +1177,42 @@ function escapeShellArg(arg: string): string {
     .replace(/[&;`$"'<>|]/g, ""); // Shell 特殊字符 - Shell special characters
 }
 
-// 過濾當前任務列表
-// Filter current task list
-function filterCurrentTasks(
+// 檢查任務是否包含所有關鍵字，每個欄位只轉換一次小寫
+// Check whether a task contains every keyword, lowercasing each field only once
+function taskMatchesKeywords(task: Task, lowerKeywords: string[]): boolean {
+  const lowerFields = [
+    task.name,
+    task.description,
+    task.notes,
+    task.implementationGuide,
+    task.summary,
+  ]
+    .filter((field): field is string => !!field)
+    .map((field) => field.toLowerCase());
+
+  return lowerKeywords.every((keyword) =>
+    lowerFields.some((field) => field.includes(keyword))
+  );
+}
+
+// 依查詢條件過濾任務列表
+// Filter task list by query
+function filterTasksByQuery(
   tasks: Task[],
   query: string,
   isId: boolean
 ): Task[] {
   if (isId) {
     return tasks.filter((task) => task.id === query);
-  } else {
-    const keywords = query.split(/\s+/).filter((k) => k.length > 0);
-    if (keywords.length === 0) return tasks;
-
-    return tasks.filter((task) => {
-      return keywords.every((keyword) => {
-        const lowerKeyword = keyword.toLowerCase();
-        return (
-          task.name.toLowerCase().includes(lowerKeyword) ||
-          task.description.toLowerCase().includes(lowerKeyword) ||
-          (task.notes && task.notes.toLowerCase().includes(lowerKeyword)) ||
-          (task.implementationGuide &&
-            task.implementationGuide.toLowerCase().includes(lowerKeyword)) ||
-          (task.summary && task.summary.toLowerCase().includes(lowerKeyword))
-        );
-      });
-    });
   }
+
+  // 關鍵字只拆分與轉換一次
+  // Split and lowercase keywords only once
+  const lowerKeywords = query
+    .split(/\s+/)
+    .filter((k) => k.length > 0)
+    .map((k) => k.toLowerCase());
+  if (lowerKeywords.length === 0) return tasks;
+
+  return tasks.filter((task) => taskMatchesKeywords(task, lowerKeywords));
 }
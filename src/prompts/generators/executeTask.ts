@@ -74,47 +74,44 @@ export async function getExecuteTaskPrompt(
   const { task, complexityAssessment, relatedFilesSummary, dependencyTasks } =
     params;
 
-  const notesTemplate = await loadPromptFromTemplate("executeTask/notes.md");
   let notesPrompt = "";
   if (task.notes) {
+    const notesTemplate = await loadPromptFromTemplate("executeTask/notes.md");
     notesPrompt = generatePrompt(notesTemplate, {
       notes: task.notes,
     });
   }
 
-  const implementationGuideTemplate = await loadPromptFromTemplate(
-    "executeTask/implementationGuide.md"
-  );
   let implementationGuidePrompt = "";
   if (task.implementationGuide) {
+    const implementationGuideTemplate = await loadPromptFromTemplate(
+      "executeTask/implementationGuide.md"
+    );
     implementationGuidePrompt = generatePrompt(implementationGuideTemplate, {
       implementationGuide: task.implementationGuide,
     });
   }
 
-  const verificationCriteriaTemplate = await loadPromptFromTemplate(
-    "executeTask/verificationCriteria.md"
-  );
   let verificationCriteriaPrompt = "";
   if (task.verificationCriteria) {
+    const verificationCriteriaTemplate = await loadPromptFromTemplate(
+      "executeTask/verificationCriteria.md"
+    );
     verificationCriteriaPrompt = generatePrompt(verificationCriteriaTemplate, {
       verificationCriteria: task.verificationCriteria,
     });
   }
 
-  const analysisResultTemplate = await loadPromptFromTemplate(
-    "executeTask/analysisResult.md"
-  );
   let analysisResultPrompt = "";
   if (task.analysisResult) {
+    const analysisResultTemplate = await loadPromptFromTemplate(
+      "executeTask/analysisResult.md"
+    );
     analysisResultPrompt = generatePrompt(analysisResultTemplate, {
       analysisResult: task.analysisResult,
     });
   }
 
-  const dependencyTasksTemplate = await loadPromptFromTemplate(
-    "executeTask/dependencyTasks.md"
-  );
   let dependencyTasksPrompt = "";
   if (dependencyTasks && dependencyTasks.length > 0) {
     const completedDependencyTasks = dependencyTasks.filter(
@@ -129,6 +126,9 @@ export async function getExecuteTaskPrompt(
           // "*No completion summary*"
         }\n\n`;
       }
+      const dependencyTasksTemplate = await loadPromptFromTemplate(
+        "executeTask/dependencyTasks.md"
+      );
       dependencyTasksPrompt = generatePrompt(dependencyTasksTemplate, {
         dependencyTasks: dependencyTasksContent,
       });
@@ -144,11 +144,11 @@ export async function getExecuteTaskPrompt(
     // "The current task has no associated files."
   });
 
-  const complexityTemplate = await loadPromptFromTemplate(
-    "executeTask/complexity.md"
-  );
   let complexityPrompt = "";
   if (complexityAssessment) {
+    const complexityTemplate = await loadPromptFromTemplate(
+      "executeTask/complexity.md"
+    );
     const complexityStyle = getComplexityStyle(complexityAssessment.level);
     let recommendationContent = "";
     if (
@@ -0,0 +1,35 @@
+import { describe, it, expect } from 'vitest';
+import { generatePrompt } from './loader.js';
+
+describe('loader', () => {
+  describe('generatePrompt', () => {
+    it('should replace every occurrence of a placeholder', () => {
+      expect(generatePrompt('{name} and {name}', { name: 'task' })).toBe('task and task');
+    });
+
+    it('should replace undefined and null values with an empty string', () => {
+      expect(generatePrompt('[{a}][{b}]', { a: undefined, b: null })).toBe('[][]');
+    });
+
+    it('should stringify non-string values', () => {
+      expect(generatePrompt('{count} tasks', { count: 3 })).toBe('3 tasks');
+    });
+
+    it('should leave placeholders without a matching parameter unchanged', () => {
+      expect(generatePrompt('{known} {unknown}', { known: 'x' })).toBe('x {unknown}');
+    });
+
+    it('should not expand placeholders contained in parameter values', () => {
+      expect(
+        generatePrompt('{name}: {description}', {
+          name: 'Use {description} here',
+          description: 'details',
+        })
+      ).toBe('Use {description} here: details');
+    });
+
+    it('should insert values containing $ patterns literally', () => {
+      expect(generatePrompt('cost: {price}', { price: '$& $1 $$' })).toBe('cost: $& $1 $$');
+    });
+  });
+});
@@ -5,7 +5,8 @@
  * Provides functionality to load custom prompts from environment variables
  */
 
-import fs from "fs";
+import fs from "fs/promises";
+import type { Stats } from "fs";
 import path from "path";
 import { fileURLToPath } from "url";
 import { getDataDir } from "../utils/paths.js";
@@ -13,6 +14,27 @@ import { getDataDir } from "../utils/paths.js";
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
+// 模板內容快取，以檔案路徑為鍵，並以修改時間及檔案大小驗證是否過期
+// Template content cache, keyed by file path and validated by modification time and size
+const templateCache = new Map<
+  string,
+  { mtimeMs: number; size: number; content: string }
+>();
+
+// 模板佔位符，例如 {paramName}
+// Template placeholder, e.g. {paramName}
+const PLACEHOLDER_REGEX = /\{(\w+)\}/g;
+
+// 非阻塞地取得檔案狀態，檔案不存在時返回 null
+// Get a file's stats without blocking the event loop, returning null if the file does not exist
+async function statFile(filePath: string): Promise<Stats | null> {
+  try {
+    return await fs.stat(filePath);
+  } catch {
+    return null;
+  }
+}
+
 function processEnvString(input: string | undefined): string {
   if (!input) return "";
 
@@ -74,23 +96,18 @@ export function generatePrompt(
   promptTemplate: string,
   params: Record<string, any> = {}
 ): string {
-  // 使用簡單的模板替換方法，將 {paramName} 替換為對應的參數值
-  // Use simple template replacement method to replace {paramName} with corresponding parameter values
-  let result = promptTemplate;
+  // 單次掃描模板，將 {paramName} 替換為對應的參數值，未提供的佔位符保持不變
+  // Scan the template once, replacing {paramName} with the corresponding parameter value and leaving unknown placeholders unchanged
+  return promptTemplate.replace(PLACEHOLDER_REGEX, (placeholder, key: string) => {
+    if (!Object.prototype.hasOwnProperty.call(params, key)) {
+      return placeholder;
+    }
 
-  Object.entries(params).forEach(([key, value]) => {
     // 如果值為 undefined 或 null，使用空字串替換
     // If value is undefined or null, replace with empty string
-    const replacementValue =
-      value !== undefined && value !== null ? String(value) : "";
-
-    // 使用正則表達式替換所有匹配的佔位符
-    // Use regular expression to replace all matching placeholders
-    const placeholder = new RegExp(`\\{${key}\\}`, "g");
-    result = result.replace(placeholder, replacementValue);
+    const value = params[key];
+    return value !== undefined && value !== null ? String(value) : "";
   });
-
-  return result;
 }
 
 /**
@@ -111,6 +128,7 @@ export async function loadPromptFromTemplate(
   const builtInTemplatesBaseDir = __dirname;
 
   let finalPath = "";
+  let finalStats: Stats | null = null;
   const checkedPaths: string[] = []; // 用於更詳細的錯誤報告
   // Used for more detailed error reporting
 
@@ -120,7 +138,8 @@ export async function loadPromptFromTemplate(
   // path.resolve can handle cases where templateSetName is an absolute path
   const customFilePath = path.resolve(dataDir, templateSetName, templatePath);
   checkedPaths.push(`Custom: ${customFilePath}`);
-  if (fs.existsSync(customFilePath)) {
+  finalStats = await statFile(customFilePath);
+  if (finalStats !== null) {
     finalPath = customFilePath;
   }
 
@@ -135,7 +154,8 @@ export async function loadPromptFromTemplate(
       templatePath
     );
     checkedPaths.push(`Specific Built-in: ${specificBuiltInFilePath}`);
-    if (fs.existsSync(specificBuiltInFilePath)) {
+    finalStats = await statFile(specificBuiltInFilePath);
+    if (finalStats !== null) {
       finalPath = specificBuiltInFilePath;
     }
   }
@@ -149,14 +169,15 @@ export async function loadPromptFromTemplate(
       templatePath
     );
     checkedPaths.push(`Default Built-in ('en'): ${defaultBuiltInFilePath}`);
-    if (fs.existsSync(defaultBuiltInFilePath)) {
+    finalStats = await statFile(defaultBuiltInFilePath);
+    if (finalStats !== null) {
       finalPath = defaultBuiltInFilePath;
     }
   }
 
   // 4. 如果所有路徑都找不到模板，拋出錯誤
   // 4. If template is not found in all paths, throw error
-  if (!finalPath) {
+  if (!finalPath || finalStats === null) {
     throw new Error(
       `Template file not found: '${templatePath}' in template set '${templateSetName}'. Checked paths:\n - ${checkedPaths.join(
         "\n - "
@@ -164,7 +185,15 @@ export async function loadPromptFromTemplate(
     );
   }
 
-  // 5. 讀取找到的文件
-  // 5. Read the found file
-  return fs.readFileSync(finalPath, "utf-8");
+  // 5. 讀取找到的文件，若快取仍有效則直接使用快取內容（沿用查找時取得的檔案狀態）
+  // 5. Read the found file, reusing the cached content if it is still valid (using the stats from the lookup)
+  const { mtimeMs, size } = finalStats;
+  const cached = templateCache.get(finalPath);
+  if (cached && cached.mtimeMs === mtimeMs && cached.size === size) {
+    return cached.content;
+  }
+
+  const content = await fs.readFile(finalPath, "utf-8");
+  templateCache.set(finalPath, { mtimeMs, size, content });
+  return content;
 }
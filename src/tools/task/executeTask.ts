@@ -1,6 +1,7 @@
 import { z } from "zod";
 import { UUID_V4_REGEX } from "../../utils/regex.js";
 import {
+  getAllTasks,
   getTaskById,
   updateTaskStatus,
   canExecuteTask,
@@ -23,6 +24,42 @@ export const executeTaskSchema = z.object({
     // Unique identifier of the task to be executed, must be a valid task ID that exists in the system
 });
 
+// 獲取依賴任務，只讀取一次任務列表
+// Get dependency tasks, reading the task list only once
+async function loadDependencyTasks(task: Task): Promise<Task[]> {
+  if (!task.dependencies || task.dependencies.length === 0) {
+    return [];
+  }
+
+  const allTasks = await getAllTasks();
+  const tasksById = new Map(allTasks.map((t) => [t.id, t]));
+  const dependencyTasks: Task[] = [];
+  for (const dep of task.dependencies) {
+    const depTask = tasksById.get(dep.taskId);
+    if (depTask) {
+      dependencyTasks.push(depTask);
+    }
+  }
+  return dependencyTasks;
+}
+
+// 加載任務相關的文件內容摘要
+// Load the summary of task-related file content
+async function loadRelatedFilesSummary(task: Task): Promise<string> {
+  if (!task.relatedFiles || task.relatedFiles.length === 0) {
+    return "";
+  }
+
+  try {
+    const relatedFilesResult = await loadTaskRelatedFiles(task.relatedFiles);
+    return typeof relatedFilesResult === "string"
+      ? relatedFilesResult
+      : relatedFilesResult.summary || "";
+  } catch (error) {
+    return "Error loading related files, please check the files manually.";
+  }
+}
+
 export async function executeTask({
   taskId,
 }: z.infer<typeof executeTaskSchema>) {
@@ -96,9 +133,20 @@ export async function executeTask({
     // Update task status to "in progress"
     await updateTaskStatus(taskId, TaskStatus.IN_PROGRESS);
 
-    // 評估任務複雜度
-    // Assess task complexity
-    const complexityResult = await assessTaskComplexity(taskId);
+    // 複雜度評估、依賴任務與相關文件彼此獨立，並行載入
+    // Complexity assessment, dependency tasks and related files are independent, so load them concurrently
+    const [complexityResult, dependencyTasks, relatedFilesSummary] =
+      await Promise.all([
+        // 評估任務複雜度
+        // Assess task complexity
+        assessTaskComplexity(taskId),
+        // 獲取依賴任務，用於顯示完成摘要
+        // Get dependency tasks for displaying completion summary
+        loadDependencyTasks(task),
+        // 加載任務相關的文件內容
+        // Load task-related file content
+        loadRelatedFilesSummary(task),
+      ]);
 
     // 將複雜度結果轉換為適當的格式
     // Convert complexity results to appropriate format
@@ -113,36 +161,6 @@ export async function executeTask({
         }
       : undefined;
 
-    // 獲取依賴任務，用於顯示完成摘要
-    // Get dependency tasks for displaying completion summary
-    const dependencyTasks: Task[] = [];
-    if (task.dependencies && task.dependencies.length > 0) {
-      for (const dep of task.dependencies) {
-        const depTask = await getTaskById(dep.taskId);
-        if (depTask) {
-          dependencyTasks.push(depTask);
-        }
-      }
-    }
-
-    // 加載任務相關的文件內容
-    // Load task-related file content
-    let relatedFilesSummary = "";
-    if (task.relatedFiles && task.relatedFiles.length > 0) {
-      try {
-        const relatedFilesResult = await loadTaskRelatedFiles(
-          task.relatedFiles
-        );
-        relatedFilesSummary =
-          typeof relatedFilesResult === "string"
-            ? relatedFilesResult
-            : relatedFilesResult.summary || "";
-      } catch (error) {
-        relatedFilesSummary =
-          "Error loading related files, please check the files manually.";
-      }
-    }
-
     // 使用prompt生成器獲取最終prompt
     // Use prompt generator to get final prompt
     const prompt = await getExecuteTaskPrompt({
@@ -14,24 +14,26 @@ export const listTasksSchema = z.object({
 // List tasks tool
 export async function listTasks({ status }: z.infer<typeof listTasksSchema>) {
   const tasks = await getAllTasks();
+
+  // 單次遍歷將任務依狀態分組，篩選結果直接取自分組
+  // Group tasks by status in a single pass and take the filtered list from the groups
+  const tasksByStatus: Record<string, typeof tasks> = {};
+  for (const task of tasks) {
+    (tasksByStatus[task.status] ??= []).push(task);
+  }
+
   let filteredTasks = tasks;
   switch (status) {
     case "all":
       break;
     case "pending":
-      filteredTasks = tasks.filter(
-        (task) => task.status === TaskStatus.PENDING
-      );
+      filteredTasks = tasksByStatus[TaskStatus.PENDING] || [];
       break;
     case "in_progress":
-      filteredTasks = tasks.filter(
-        (task) => task.status === TaskStatus.IN_PROGRESS
-      );
+      filteredTasks = tasksByStatus[TaskStatus.IN_PROGRESS] || [];
       break;
     case "completed":
-      filteredTasks = tasks.filter(
-        (task) => task.status === TaskStatus.COMPLETED
-      );
+      filteredTasks = tasksByStatus[TaskStatus.COMPLETED] || [];
       break;
   }
 
@@ -51,14 +53,6 @@ export async function listTasks({ status }: z.infer<typeof listTasksSchema>) {
     };
   }
 
-  const tasksByStatus = tasks.reduce((acc, task) => {
-    if (!acc[task.status]) {
-      acc[task.status] = [];
-    }
-    acc[task.status].push(task);
-    return acc;
-  }, {} as Record<string, typeof tasks>);
-
   // 使用prompt生成器獲取最終prompt
   // Use prompt generator to get the final prompt
   const prompt = await getListTasksPrompt({
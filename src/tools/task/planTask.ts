@@ -53,14 +53,15 @@ export async function planTask({
     try {
       const allTasks = await getAllTasks();
 
-      // 將任務分為已完成和未完成兩類
-      // Divide tasks into completed and incomplete categories
-      completedTasks = allTasks.filter(
-        (task) => task.status === TaskStatus.COMPLETED
-      );
-      pendingTasks = allTasks.filter(
-        (task) => task.status !== TaskStatus.COMPLETED
-      );
+      // 單次遍歷將任務分為已完成和未完成兩類
+      // Divide tasks into completed and incomplete categories in a single pass
+      for (const task of allTasks) {
+        if (task.status === TaskStatus.COMPLETED) {
+          completedTasks.push(task);
+        } else {
+          pendingTasks.push(task);
+        }
+      }
     } catch (error) {}
   }
 
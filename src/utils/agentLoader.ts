@@ -15,6 +15,83 @@ export interface Agent {
   content?: string;
 }
 
+// Parsed agent files, keyed by path and revalidated by mtime and size
+const agentFileCache = new Map<string, { mtimeMs: number; size: number; agent: Agent }>();
+
+/**
+ * Parse an agent definition file's content
+ * @param filename Agent file name, used to derive the agent name
+ * @param filePath Full path of the agent file
+ * @param content File content
+ * @returns Parsed agent
+ */
+function parseAgentFile(filename: string, filePath: string, content: string): Agent {
+  // Extract agent name from filename (remove extension)
+  const name = filename.replace(/\.(md|yaml|yml)$/, "");
+  
+  // Try to extract description from content (first line or title)
+  let description = "";
+  const lines = content.split("\n");
+  for (const line of lines) {
+    const trimmed = line.trim();
+    if (trimmed && !trimmed.startsWith("#")) {
+      description = trimmed.substring(0, 100);
+      break;
+    } else if (trimmed.startsWith("# ")) {
+      description = trimmed.substring(2).trim();
+      break;
+    }
+  }
+
+  return {
+    name,
+    description,
+    path: filePath,
+    content
+  };
+}
+
+/**
+ * Load agent definitions from a single agents directory
+ * @param agentsDir Directory containing agent .md/.yaml/.yml files
+ * @returns Array of agents found in the directory
+ */
+async function loadAgentsFromDir(agentsDir: string): Promise<Agent[]> {
+  try {
+    const files = await fs.readdir(agentsDir);
+    const agentFiles = files.filter(file => 
+      file.endsWith(".md") || file.endsWith(".yaml") || file.endsWith(".yml")
+    );
+
+    return await Promise.all(agentFiles.map(async (filename) => {
+      try {
+        const filePath = path.join(agentsDir, filename);
+        const { mtimeMs, size } = await fs.stat(filePath);
+        
+        // Reuse the parsed agent if the file has not changed since it was cached
+        const cached = agentFileCache.get(filePath);
+        if (cached && cached.mtimeMs === mtimeMs && cached.size === size) {
+          return { ...cached.agent };
+        }
+
+        const content = await fs.readFile(filePath, "utf-8");
+        const agent = parseAgentFile(filename, filePath, content);
+        agentFileCache.set(filePath, { mtimeMs, size, agent });
+        return { ...agent };
+      } catch (err) {
+        // Error reading individual agent file
+        return {
+          name: filename.replace(/\.(md|yaml|yml)$/, ""),
+          description: "Error loading agent"
+        };
+      }
+    }));
+  } catch (err) {
+    // Agents directory doesn't exist
+    return [];
+  }
+}
+
 /**
  * Load global agents from the Claude folder agents directory
  * @returns Array of available global agents
@@ -38,56 +115,7 @@ export async function loadGlobalAgents(): Promise<Agent[]> {
       return [];
     }
 
-    const agentsDir = path.join(claudeFolderPath, "agents");
-    
-    try {
-      const files = await fs.readdir(agentsDir);
-      const agentFiles = files.filter(file => 
-        file.endsWith(".md") || file.endsWith(".yaml") || file.endsWith(".yml")
-      );
-
-      const agents: Agent[] = await Promise.all(agentFiles.map(async (filename) => {
-        try {
-          const filePath = path.join(agentsDir, filename);
-          const content = await fs.readFile(filePath, "utf-8");
-          
-          // Extract agent name from filename (remove extension)
-          const name = filename.replace(/\.(md|yaml|yml)$/, "");
-          
-          // Try to extract description from content (first line or title)
-          let description = "";
-          const lines = content.split("\n");
-          for (const line of lines) {
-            const trimmed = line.trim();
-            if (trimmed && !trimmed.startsWith("#")) {
-              description = trimmed.substring(0, 100);
-              break;
-            } else if (trimmed.startsWith("# ")) {
-              description = trimmed.substring(2).trim();
-              break;
-            }
-          }
-
-          return {
-            name,
-            description,
-            path: filePath,
-            content
-          };
-        } catch (err) {
-          // Error reading individual agent file
-          return {
-            name: filename.replace(/\.(md|yaml|yml)$/, ""),
-            description: "Error loading agent"
-          };
-        }
-      }));
-
-      return agents;
-    } catch (err) {
-      // Agents directory doesn't exist
-      return [];
-    }
+    return await loadAgentsFromDir(path.join(claudeFolderPath, "agents"));
   } catch (error) {
     // Error in the process
     return [];
@@ -101,56 +129,7 @@ export async function loadGlobalAgents(): Promise<Agent[]> {
  */
 export async function loadProjectAgents(projectRoot: string): Promise<Agent[]> {
   try {
-    const agentsDir = path.join(projectRoot, ".claude", "agents");
-    
-    try {
-      const files = await fs.readdir(agentsDir);
-      const agentFiles = files.filter(file => 
-        file.endsWith(".md") || file.endsWith(".yaml") || file.endsWith(".yml")
-      );
-
-      const agents: Agent[] = await Promise.all(agentFiles.map(async (filename) => {
-        try {
-          const filePath = path.join(agentsDir, filename);
-          const content = await fs.readFile(filePath, "utf-8");
-          
-          // Extract agent name from filename (remove extension)
-          const name = filename.replace(/\.(md|yaml|yml)$/, "");
-          
-          // Try to extract description from content
-          let description = "";
-          const lines = content.split("\n");
-          for (const line of lines) {
-            const trimmed = line.trim();
-            if (trimmed && !trimmed.startsWith("#")) {
-              description = trimmed.substring(0, 100);
-              break;
-            } else if (trimmed.startsWith("# ")) {
-              description = trimmed.substring(2).trim();
-              break;
-            }
-          }
-
-          return {
-            name,
-            description,
-            path: filePath,
-            content
-          };
-        } catch (err) {
-          // Error reading individual agent file
-          return {
-            name: filename.replace(/\.(md|yaml|yml)$/, ""),
-            description: "Error loading agent"
-          };
-        }
-      }));
-
-      return agents;
-    } catch (err) {
-      // Agents directory doesn't exist
-      return [];
-    }
+    return await loadAgentsFromDir(path.join(projectRoot, ".claude", "agents"));
   } catch (error) {
     // Error in the process
     return [];
@@ -163,8 +142,11 @@ export async function loadProjectAgents(projectRoot: string): Promise<Agent[]> {
  * @returns Combined array of all available agents
  */
 export async function getAllAvailableAgents(projectRoot?: string): Promise<Agent[]> {
-  const globalAgents = await loadGlobalAgents();
-  const projectAgents = projectRoot ? await loadProjectAgents(projectRoot) : [];
+  // Global and project agents are independent, so load them concurrently
+  const [globalAgents, projectAgents] = await Promise.all([
+    loadGlobalAgents(),
+    projectRoot ? loadProjectAgents(projectRoot) : Promise.resolve([]),
+  ]);
   
   // Combine agents and remove duplicates (project agents override global ones)
   const agentMap = new Map<string, Agent>();
@@ -89,38 +89,71 @@ const AGENT_KEYWORD_MAPPINGS: AgentKeywordMap = {
   }
 };
 
+// Compiled whole-word patterns, keyed by lowercase keyword
+const keywordPatternCache = new Map<string, RegExp>();
+
+// Primary keywords that strongly indicate a testing task
+const PRIMARY_TESTING_KEYWORDS = new Set([
+  'test', 'testing', 'unit test', 'unit tests', 'jest', 'mocha', 'qa', 'test suite'
+]);
+
+// Primary keywords that strongly indicate a fullstack task
+const PRIMARY_FULLSTACK_KEYWORDS = new Set(['fullstack', 'full-stack', 'full stack']);
+
+/**
+ * Get the compiled whole-word pattern for a keyword.
+ * Patterns are global and shared, so only use them with String.prototype.match
+ * and String.prototype.search, which do not depend on lastIndex state.
+ */
+function getKeywordPattern(keyword: string): RegExp {
+  const lowerKeyword = keyword.toLowerCase();
+  let pattern = keywordPatternCache.get(lowerKeyword);
+  if (!pattern) {
+    // Escape special regex characters in the keyword
+    const escapedKeyword = lowerKeyword.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+    pattern = new RegExp(`\\b${escapedKeyword}\\b`, 'gi');
+    keywordPatternCache.set(lowerKeyword, pattern);
+  }
+  return pattern;
+}
+
+/**
+ * Check whether text contains the keyword as a whole word
+ */
+function containsKeyword(text: string, keyword: string): boolean {
+  return text.search(getKeywordPattern(keyword)) !== -1;
+}
+
 /**
  * Calculate the relevance score for a given text against a set of keywords
  */
 function calculateKeywordScore(text: string, keywords: string[], weight: number, agentType?: string): number {
   const lowerText = text.toLowerCase();
+  const hasWriteOrCreate = lowerText.includes('write') || lowerText.includes('create');
   let score = 0;
-  let matchCount = 0;
+  let uniqueMatchedKeywords = 0;
   
   for (const keyword of keywords) {
     const lowerKeyword = keyword.toLowerCase();
     // Check for whole word matches (with word boundaries)
-    // Escape special regex characters in the keyword
-    const escapedKeyword = lowerKeyword.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-    const regex = new RegExp(`\\b${escapedKeyword}\\b`, 'gi');
-    const matches = lowerText.match(regex);
+    const matches = lowerText.match(getKeywordPattern(lowerKeyword));
     
     if (matches) {
-      matchCount += matches.length;
+      uniqueMatchedKeywords++;
       // Give higher score for exact matches vs partial matches
       let keywordScore = matches.length * weight;
       
       // Special bonus for primary keywords that strongly indicate the agent type
       if (agentType === 'testing') {
         // Check for testing-specific keywords and phrases
-        if (['test', 'testing', 'unit test', 'unit tests', 'jest', 'mocha', 'qa', 'test suite'].includes(lowerKeyword)) {
+        if (PRIMARY_TESTING_KEYWORDS.has(lowerKeyword)) {
           keywordScore *= 3; // Triple score for primary testing keywords
         }
         // Additional boost if the text contains "write" or "create" with "test"
-        if (lowerText.includes('write') || lowerText.includes('create')) {
+        if (hasWriteOrCreate) {
           keywordScore *= 1.5;
         }
-      } else if (agentType === 'fullstack' && ['fullstack', 'full-stack', 'full stack'].includes(lowerKeyword)) {
+      } else if (agentType === 'fullstack' && PRIMARY_FULLSTACK_KEYWORDS.has(lowerKeyword)) {
         keywordScore *= 2; // Double score for primary fullstack keywords
       }
       
@@ -129,11 +162,6 @@ function calculateKeywordScore(text: string, keywords: string[], weight: number,
   }
   
   // Bonus for multiple different keywords matched
-  const uniqueMatchedKeywords = keywords.filter(keyword => {
-    const escapedKeyword = keyword.toLowerCase().replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-    return new RegExp(`\\b${escapedKeyword}\\b`, 'i').test(lowerText);
-  }).length;
-  
   if (uniqueMatchedKeywords > 1) {
     score += (uniqueMatchedKeywords - 1) * 0.5 * weight;
   }
@@ -212,9 +240,7 @@ export function matchAgentToTask(task: Task, availableAgents: Agent[]): string |
     
     // Check each keyword against agent name
     for (const keyword of typeKeywords) {
-      const escapedKeyword = keyword.toLowerCase().replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-      const regex = new RegExp(`\\b${escapedKeyword}\\b`, 'i');
-      if (regex.test(agentNameLower)) {
+      if (containsKeyword(agentNameLower, keyword)) {
         agentScore += 2; // Higher weight for name matches
       }
     }
@@ -235,9 +261,7 @@ export function matchAgentToTask(task: Task, availableAgents: Agent[]): string |
     if (agent.description) {
       const descriptionLower = agent.description.toLowerCase();
       for (const keyword of typeKeywords) {
-        const escapedKeyword = keyword.toLowerCase().replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-        const regex = new RegExp(`\\b${escapedKeyword}\\b`, 'i');
-        if (regex.test(descriptionLower)) {
+        if (containsKeyword(descriptionLower, keyword)) {
           return agent.name;
         }
       }
@@ -273,10 +297,9 @@ export function getKeywordMatchDetails(task: Task): Array<{ type: string; score:
   const results = [];
   
   for (const [agentType, mapping] of Object.entries(AGENT_KEYWORD_MAPPINGS)) {
-    const matchedKeywords = mapping.keywords.filter(keyword => {
-      const escapedKeyword = keyword.toLowerCase().replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-      return new RegExp(`\\b${escapedKeyword}\\b`, 'i').test(combinedText);
-    });
+    const matchedKeywords = mapping.keywords.filter(keyword =>
+      containsKeyword(combinedText, keyword)
+    );
     
     if (matchedKeywords.length > 0) {
       const score = calculateKeywordScore(combinedText, mapping.keywords, mapping.weight, agentType);
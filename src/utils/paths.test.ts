@@ -0,0 +1,72 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import path from 'path';
+import { Server } from '@modelcontextprotocol/sdk/server/index.js';
+import { getDataDir, setGlobalServer, invalidateRootsCache } from './paths.js';
+
+// Helper function to create a stub server exposing the given roots behaviour
+function createStubServer(listRoots: () => Promise<unknown>, listChanged: boolean) {
+  const stub = {
+    listRoots: vi.fn(listRoots),
+    getClientCapabilities: () => ({ roots: { listChanged } }),
+  };
+  return stub;
+}
+
+const ROOT = '/workspace/project';
+const rootsResult = () => Promise.resolve({ roots: [{ uri: `file://${ROOT}` }] });
+
+describe('paths', () => {
+  describe('getDataDir roots caching', () => {
+    const originalDataDir = process.env.DATA_DIR;
+
+    beforeEach(() => {
+      delete process.env.DATA_DIR;
+    });
+
+    afterEach(() => {
+      if (originalDataDir === undefined) {
+        delete process.env.DATA_DIR;
+      } else {
+        process.env.DATA_DIR = originalDataDir;
+      }
+    });
+
+    it('should reuse the roots result when the client notifies roots changes', async () => {
+      const server = createStubServer(rootsResult, true);
+      setGlobalServer(server as unknown as Server);
+
+      expect(await getDataDir()).toBe(path.join(ROOT, 'data'));
+      expect(await getDataDir()).toBe(path.join(ROOT, 'data'));
+      expect(server.listRoots).toHaveBeenCalledTimes(1);
+    });
+
+    it('should query roots again after invalidateRootsCache', async () => {
+      const server = createStubServer(rootsResult, true);
+      setGlobalServer(server as unknown as Server);
+
+      await getDataDir();
+      invalidateRootsCache();
+      await getDataDir();
+      expect(server.listRoots).toHaveBeenCalledTimes(2);
+    });
+
+    it('should not cache a rejected roots query', async () => {
+      const server = createStubServer(rootsResult, true);
+      server.listRoots.mockImplementationOnce(() => Promise.reject(new Error('roots unavailable')));
+      setGlobalServer(server as unknown as Server);
+
+      expect(await getDataDir()).not.toBe(path.join(ROOT, 'data'));
+      expect(await getDataDir()).toBe(path.join(ROOT, 'data'));
+      expect(server.listRoots).toHaveBeenCalledTimes(2);
+    });
+
+    it('should query roots on every call when the client does not notify roots changes', async () => {
+      const server = createStubServer(rootsResult, false);
+      setGlobalServer(server as unknown as Server);
+
+      await getDataDir();
+      await getDataDir();
+      expect(server.listRoots).toHaveBeenCalledTimes(2);
+    });
+  });
+});
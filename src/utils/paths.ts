@@ -13,12 +13,25 @@ const PROJECT_ROOT = path.resolve(__dirname, "../..");
 // Global server instance
 let globalServer: Server | null = null;
 
+// 客戶端 roots 解析結果的快取（以 Promise 保存，讓並行呼叫共用同一次 listRoots 請求）
+// Cache of the resolved client root (kept as a Promise so concurrent callers share a single listRoots request)
+let rootPathPromise: Promise<string | null> | null = null;
+
 /**
  * 設置全局 server 實例
  * Set global server instance
  */
 export function setGlobalServer(server: Server): void {
   globalServer = server;
+  rootPathPromise = null;
+}
+
+/**
+ * 清除 roots 快取，於客戶端通知 roots 變更時呼叫
+ * Clear the roots cache, called when the client notifies that its roots changed
+ */
+export function invalidateRootsCache(): void {
+  rootPathPromise = null;
 }
 
 /**
@@ -29,6 +42,58 @@ export function getGlobalServer(): Server | null {
   return globalServer;
 }
 
+/**
+ * 向客戶端查詢 roots，返回第一筆 file:// 開頭的 root 路徑
+ * Query the client for its roots and return the path of the first root starting with file://
+ */
+async function listRootPath(server: Server): Promise<string | null> {
+  const roots = await server.listRoots();
+
+  // 找出第一筆 file:// 開頭的 root
+  // Find the first root starting with file://
+  if (roots.roots && roots.roots.length > 0) {
+    const firstFileRoot = roots.roots.find((root) =>
+      root.uri.startsWith("file://")
+    );
+    if (firstFileRoot) {
+      // 從 file:// URI 中提取實際路徑
+      // Extract actual path from file:// URI
+      // Windows: file:///C:/path -> C:/path
+      // Unix: file:///path -> /path
+      if (process.platform === 'win32') {
+        return firstFileRoot.uri.replace("file:///", "").replace(/\//g, "\\");
+      } else {
+        return firstFileRoot.uri.replace("file://", "");
+      }
+    }
+  }
+
+  return null;
+}
+
+/**
+ * 取得 root 路徑，僅在客戶端會通知 roots 變更時快取，查詢失敗時不快取以便下次重試
+ * Get the root path; it is cached only when the client notifies roots changes, and failed queries are not cached so the next call retries
+ */
+function getRootPath(server: Server): Promise<string | null> {
+  // 客戶端不會發送 roots/list_changed 通知時無法得知快取是否過期，每次重新查詢
+  // Without roots/list_changed notifications there is no way to know the cache is stale, so re-query every time
+  if (!server.getClientCapabilities()?.roots?.listChanged) {
+    return listRootPath(server);
+  }
+
+  if (!rootPathPromise) {
+    const promise = listRootPath(server);
+    rootPathPromise = promise;
+    promise.catch(() => {
+      if (rootPathPromise === promise) {
+        rootPathPromise = null;
+      }
+    });
+  }
+  return rootPathPromise;
+}
+
 /**
  * 取得 DATA_DIR 路徑
  * Get DATA_DIR path
@@ -43,26 +108,7 @@ export async function getDataDir(): Promise<string> {
 
   if (server) {
     try {
-      const roots = await server.listRoots();
-
-      // 找出第一筆 file:// 開頭的 root
-      // Find the first root starting with file://
-      if (roots.roots && roots.roots.length > 0) {
-        const firstFileRoot = roots.roots.find((root) =>
-          root.uri.startsWith("file://")
-        );
-        if (firstFileRoot) {
-          // 從 file:// URI 中提取實際路徑
-          // Extract actual path from file:// URI
-          // Windows: file:///C:/path -> C:/path
-          // Unix: file:///path -> /path
-          if (process.platform === 'win32') {
-            rootPath = firstFileRoot.uri.replace("file:///", "").replace(/\//g, "\\");
-          } else {
-            rootPath = firstFileRoot.uri.replace("file://", "");
-          }
-        }
-      }
+      rootPath = await getRootPath(server);
     } catch (error) {
       // Silently handle error - console not supported in MCP
     }
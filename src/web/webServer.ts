@@ -10,6 +10,10 @@ import {
   getWebGuiFilePath,
 } from "../utils/paths.js";
 
+// 檔案變化事件合併發送的延遲時間（毫秒）
+// Delay (ms) used to coalesce file change events into a single SSE update
+const SSE_UPDATE_DEBOUNCE_MS = 100;
+
 export async function createWebServer() {
   // 創建 Express 應用
   // Create Express application
@@ -22,15 +26,16 @@ export async function createWebServer() {
   // 發送 SSE 事件的輔助函數
   // Helper function to send SSE events
   function sendSseUpdate() {
+    // 事件內容對所有客戶端相同，只序列化一次
+    // The event payload is identical for every client, so serialize it once
+    const message = `event: update\ndata: ${JSON.stringify({
+      timestamp: Date.now(),
+    })}\n\n`;
     sseClients.forEach((client) => {
       // 檢查客戶端是否仍然連接
       // Check if client is still connected
       if (!client.writableEnded) {
-        client.write(
-          `event: update\ndata: ${JSON.stringify({
-            timestamp: Date.now(),
-          })}\n\n`
-        );
+        client.write(message);
       }
     });
     // 清理已斷開的客戶端 (可選，但建議)
@@ -52,10 +57,11 @@ export async function createWebServer() {
   // Set up API routes
   app.get("/api/tasks", async (req: Request, res: Response) => {
     try {
-      // 使用 fsPromises 保持異步讀取
-      // Use fsPromises to maintain async reading
-      const tasksData = await fsPromises.readFile(TASKS_FILE_PATH, "utf-8");
-      res.json(JSON.parse(tasksData));
+      // 使用 fsPromises 保持異步讀取，解析以驗證內容完整，再直接回傳原始檔案內容，避免重新序列化
+      // Use fsPromises to maintain async reading, parse to validate the content, then send the original file bytes instead of re-serializing
+      const tasksData = await fsPromises.readFile(TASKS_FILE_PATH);
+      JSON.parse(tasksData.toString("utf-8"));
+      res.type("application/json").send(tasksData);
     } catch (error) {
       // 確保檔案不存在時返回空任務列表
       // Ensure empty task list is returned when file doesn't exist
@@ -132,6 +138,10 @@ export async function createWebServer() {
       // Get available port
       const port = process.env.WEB_PORT || (await getPort());
 
+      // 待發送的 SSE 更新計時器
+      // Timer for the pending SSE update
+      let sseUpdateTimer: NodeJS.Timeout | undefined;
+
       // 啟動 HTTP 伺服器
       // Start HTTP server
       const httpServer = app.listen(port, () => {
@@ -148,9 +158,11 @@ export async function createWebServer() {
               ) {
                 // 稍微延遲發送，以防短時間內多次觸發 (例如編輯器保存)
                 // Slightly delay sending to prevent multiple triggers in a short time (e.g., editor saves)
-                // debounce sendSseUpdate if needed
-                // Debounce sendSseUpdate if needed
-                sendSseUpdate();
+                clearTimeout(sseUpdateTimer);
+                sseUpdateTimer = setTimeout(() => {
+                  sseUpdateTimer = undefined;
+                  sendSseUpdate();
+                }, SSE_UPDATE_DEBOUNCE_MS);
               }
             });
           }
@@ -164,6 +176,10 @@ export async function createWebServer() {
       // 設置進程終止事件處理 (確保移除 watcher)
       // Set up process termination event handling (ensure watcher removal)
       const shutdownHandler = async () => {
+        // 取消尚未發送的更新
+        // Cancel any pending update
+        clearTimeout(sseUpdateTimer);
+
         // 關閉所有 SSE 連接
         // Close all SSE connections
         sseClients.forEach((client) => client.end());